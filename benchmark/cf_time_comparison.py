@@ -3,50 +3,75 @@ import cftime_rs
 import cftime
 import time
 import matplotlib.pyplot as plt
-from typing import Tuple, List
+from typing import Callable, Optional, Tuple, List
 import os
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 ITERATIONS = [1, 10, 50, 100, 500, 1000, 5000, 10000, 50000, 100000, 500000, 1000000]
+
+
+def read_only_arange(n: int) -> np.array:
+    arr = np.arange(n, dtype=np.int64)
+    arr.setflags(write=False)
+    return arr
+
+
+# Input arrays are only read by the benchmarked functions so they are built once
+# and shared by every suite
+ARRS = {n: read_only_arange(n) for n in ITERATIONS}
 UNITS = "hours since 2000-01-01 00:00:00"
 CALENDAR = "julian"
+# Below this number of elements a single call is too fast to be measured
+# reliably, so the workload is repeated to cover at least this many elements
+MIN_ELEMENTS_PER_MEASURE = 1000
+# Julian day number of 2000-01-01 in the julian calendar, i.e. the epoch of UNITS
+JULIAN_EPOCH_JDN = 2451558
 
 
 def performance_comparison_chart(
-    cftime_rs_time: List[float], cftime_time: List[float], title: str, output_file: str
+    cftime_rs_time: List[float],
+    cftime_time: List[float],
+    title: str,
+    output_file: str,
+    numba_time: Optional[List[float]] = None,
 ) -> None:
     """
     Generate a bar chart to compare the performance of cftime_rs and cftime.
+    If `numba_time` is given, it is drawn as a third reference series.
     """
 
     # Calculate performance improvement percentage
     performance_improvement = [
-        ((cftime_time - cftime_rs_time) / cftime_rs_time) * 100
-        for cftime_time, cftime_rs_time in zip(cftime_times, cftime_rs_times)
+        ((t_cf - t_rs) / t_rs) * 100 for t_cf, t_rs in zip(cftime_time, cftime_rs_time)
     ]
     fig, ax1 = plt.subplots(figsize=(10, 6))
-    x_ticks = np.linspace(min(ITERATIONS), max(ITERATIONS), len(ITERATIONS))
-    width = ITERATIONS[-1] / len(ITERATIONS) / 2
-    ax1.bar(
-        x_ticks - width / 2,
-        cftime_rs_times,
-        width=width,
-        label="cftime_rs",
-        color="royalblue",
-        alpha=0.7,
-    )
-    ax1.bar(
-        x_ticks + width / 2,
-        cftime_times,
-        width=width,
-        label="cftime",
-        color="orange",
-        alpha=0.7,
-    )
+    # ITERATIONS spans several orders of magnitude, use one evenly spaced slot per
+    # number of iterations so that the small ones remain visible
+    x_ticks = np.arange(len(ITERATIONS))
+    series = [
+        (cftime_rs_time, "cftime_rs", "royalblue"),
+        (cftime_time, "cftime", "orange"),
+    ]
+    if numba_time is not None:
+        series.append((numba_time, "numba reference", "grey"))
+    width = 0.8 / len(series)
+    for i, (times, label, color) in enumerate(series):
+        ax1.bar(
+            x_ticks + (i - (len(series) - 1) / 2) * width,
+            times,
+            width=width,
+            label=label,
+            color=color,
+            alpha=0.7,
+        )
     ax1.set_xlabel("Number of Iterations")
     ax1.set_ylabel("Execution time (seconds)")
-    ax1.set_xticks(x_ticks, [str(int(x)) for x in ITERATIONS])
+    ax1.set_xticks(x_ticks, [str(x) for x in ITERATIONS])
     ax1.set_title(title)
-    ax1.set_xticks(x_ticks)
     ax1.grid(axis="y", linestyle="--", alpha=0.7)
 
     # Create the secondary y-axis for performance improvement
@@ -67,123 +92,220 @@ def performance_comparison_chart(
     plt.savefig(os.path.join(os.path.dirname(__file__), output_file))
 
 
-def cftime_rs_benchmark(arr: np.array) -> float:
-    cftime_rs_start = time.time()
+def warm_up() -> None:
+    """
+    Call every benchmarked code path once so that one-shot initialization
+    is not counted in the first timing point.
+    """
+    arr = np.arange(2, dtype=np.int64)
     datetimes = cftime_rs.num2date(arr, UNITS, CALENDAR)
-    for datetime in datetimes:
-        datetime.__str__()
-    _ = cftime_rs.date2num(datetimes, UNITS, CALENDAR, dtype="int")
-    cftime_rs_end = time.time()
-    return cftime_rs_end - cftime_rs_start
-
+    cftime_rs.date2str(datetimes)
+    cftime_rs.date2num(datetimes, UNITS, CALENDAR, dtype="i64")
+    pydatetimes = cftime_rs.num2pydate(arr, UNITS, CALENDAR)
+    cftime_rs.pydate2num(pydatetimes, UNITS, CALENDAR, dtype="i64")
 
-def cftime_benchmark(arr: np.array) -> float:
-    cftime_start = time.time()
     datetimes = cftime.num2date(arr, UNITS, CALENDAR)
-    for datetime in datetimes:
-        datetime.__str__()
-    _ = cftime.date2num(datetimes, UNITS, CALENDAR)
-    cftime_end = time.time()
-    return cftime_end - cftime_start
+    list(map(str, datetimes))
+    cftime.date2num(datetimes, UNITS, CALENDAR)
+    pydatetimes = cftime.num2date(arr, UNITS, CALENDAR, only_use_python_datetimes=True)
+    cftime.date2num(pydatetimes, UNITS, CALENDAR)
 
+    if numba is not None:
+        # The benchmarked arrays are read-only, which numba compiles separately
+        julian_hours_round_trip(ARRS[1])
 
-def get_data_with_str() -> Tuple[List[float], List[float]]:
-    cftime_rs_times = []
-    cftime_times = []
-    print("cftime_rs_benchmark_with_str")
-    for n in ITERATIONS:
-        print(f"Number of Iterations with str: {n}")
-        arr = np.array(range(n))
-
-        cftime_rs_duration = cftime_rs_benchmark(arr)
-        cftime_rs_times.append(cftime_rs_duration)
-        cftime_duration = cftime_benchmark(arr)
-        cftime_times.append(cftime_duration)
-        print(f"cftime_rs : {cftime_rs_duration:.4f} seconds")
-        print(f"cftime    : {cftime_duration:.4f} seconds")
-    return cftime_rs_times, cftime_times
+
+def get_repeat(n: int) -> int:
+    """
+    Number of times a workload on `n` elements is repeated inside the timed region.
+    """
+    return max(1, MIN_ELEMENTS_PER_MEASURE // max(n, 1))
+
+
+def cftime_rs_benchmark(arr: np.array) -> float:
+    num2date = cftime_rs.num2date
+    date2num = cftime_rs.date2num
+    date2str = cftime_rs.date2str
+    repeat = get_repeat(len(arr))
+    cftime_rs_start = time.perf_counter()
+    for _ in range(repeat):
+        datetimes = num2date(arr, UNITS, CALENDAR)
+        strs = date2str(datetimes)
+        _ = date2num(datetimes, UNITS, CALENDAR, dtype="i64")
+    cftime_rs_end = time.perf_counter()
+    return (cftime_rs_end - cftime_rs_start) / repeat
+
+
+def cftime_benchmark(arr: np.array) -> float:
+    num2date = cftime.num2date
+    date2num = cftime.date2num
+    repeat = get_repeat(len(arr))
+    cftime_start = time.perf_counter()
+    for _ in range(repeat):
+        datetimes = num2date(arr, UNITS, CALENDAR)
+        strs = list(map(str, datetimes))
+        _ = date2num(datetimes, UNITS, CALENDAR)
+    cftime_end = time.perf_counter()
+    return (cftime_end - cftime_start) / repeat
 
 
 def cftime_rs_benchmark_without_str(arr: np.array) -> float:
-    cftime_rs_start = time.time()
-    datetimes = cftime_rs.num2date(arr, UNITS, CALENDAR)
-    _ = cftime_rs.date2num(datetimes, UNITS, CALENDAR, dtype="int")
-    cftime_rs_end = time.time()
-    return cftime_rs_end - cftime_rs_start
+    num2date = cftime_rs.num2date
+    date2num = cftime_rs.date2num
+    repeat = get_repeat(len(arr))
+    cftime_rs_start = time.perf_counter()
+    for _ in range(repeat):
+        datetimes = num2date(arr, UNITS, CALENDAR)
+        _ = date2num(datetimes, UNITS, CALENDAR, dtype="i64")
+    cftime_rs_end = time.perf_counter()
+    return (cftime_rs_end - cftime_rs_start) / repeat
 
 
 def cftime_benchmark_without_str(arr: np.array) -> float:
-    cftime_start = time.time()
-    datetimes = cftime.num2date(arr, UNITS, CALENDAR)
-    _ = cftime.date2num(datetimes, UNITS, CALENDAR)
-    cftime_end = time.time()
-    return cftime_end - cftime_start
+    num2date = cftime.num2date
+    date2num = cftime.date2num
+    repeat = get_repeat(len(arr))
+    cftime_start = time.perf_counter()
+    for _ in range(repeat):
+        datetimes = num2date(arr, UNITS, CALENDAR)
+        _ = date2num(datetimes, UNITS, CALENDAR)
+    cftime_end = time.perf_counter()
+    return (cftime_end - cftime_start) / repeat
 
 
-def get_data_without_str() -> Tuple[List[float], List[float]]:
-    cftime_rs_times = []
-    cftime_times = []
+def cftime_rs_benchmark_pydatetime_without_str(arr: np.array) -> float:
+    num2pydate = cftime_rs.num2pydate
+    pydate2num = cftime_rs.pydate2num
+    repeat = get_repeat(len(arr))
+    cftime_rs_start = time.perf_counter()
+    for _ in range(repeat):
+        datetimes = num2pydate(arr, UNITS, CALENDAR)
+        _ = pydate2num(datetimes, UNITS, CALENDAR, dtype="i64")
+    cftime_rs_end = time.perf_counter()
+    return (cftime_rs_end - cftime_rs_start) / repeat
+
+
+def cftime_benchmark_pydatetime_without_str(arr: np.array) -> float:
+    num2date = cftime.num2date
+    date2num = cftime.date2num
+    repeat = get_repeat(len(arr))
+    cftime_start = time.perf_counter()
+    for _ in range(repeat):
+        datetimes = num2date(arr, UNITS, CALENDAR, only_use_python_datetimes=True)
+        _ = date2num(datetimes, UNITS, CALENDAR)
+    cftime_end = time.perf_counter()
+    return (cftime_end - cftime_start) / repeat
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def julian_hours_round_trip(arr: np.array) -> np.array:
+        """
+        Decode hours since 2000-01-01 in the julian calendar to year, month, day and
+        hour and encode them back. This is the pure integer arithmetic part of
+        num2date/date2num and serves as a lower bound for cftime_rs.
+        """
+        out = np.empty_like(arr)
+        for i in range(arr.shape[0]):
+            days = arr[i] // 24
+            hour = arr[i] % 24
+
+            # Julian day number to julian calendar date
+            c = days + JULIAN_EPOCH_JDN + 32082
+            d = (4 * c + 3) // 1461
+            e = c - (1461 * d) // 4
+            m = (5 * e + 2) // 153
+            day = e - (153 * m + 2) // 5 + 1
+            month = m + 3 - 12 * (m // 10)
+            year = d - 4800 + m // 10
+
+            # Julian calendar date to julian day number
+            a = (14 - month) // 12
+            y = year + 4800 - a
+            m = month + 12 * a - 3
+            jdn = day + (153 * m + 2) // 5 + 365 * y + y // 4 - 32083
+            out[i] = (jdn - JULIAN_EPOCH_JDN) * 24 + hour
+        return out
+
+
+def numba_benchmark(arr: np.array) -> float:
+    round_trip = julian_hours_round_trip
+    repeat = get_repeat(len(arr))
+    numba_start = time.perf_counter()
+    for _ in range(repeat):
+        _ = round_trip(arr)
+    numba_end = time.perf_counter()
+    return (numba_end - numba_start) / repeat
+
+
+def get_data_numba() -> List[float]:
+    (numba_times,) = run_benchmark([numba_benchmark], "numba reference")
+    return numba_times
+
+
+def run_benchmark(
+    benchmark_funcs: List[Callable[[np.array], float]], label: str
+) -> List[List[float]]:
+    """
+    Run each benchmark over every number of iterations and return their timings
+    in the same order as `benchmark_funcs`.
+    """
+    times = [[] for _ in benchmark_funcs]
+    print(label)
     for n in ITERATIONS:
-        print("cftime_rs_benchmark_without_str")
-        print(f"Number of Iterations with str: {n}")
-        arr = np.array(range(n))
-
-        cftime_rs_duration = cftime_rs_benchmark_without_str(arr)
-        cftime_rs_times.append(cftime_rs_duration)
-        cftime_duration = cftime_benchmark_without_str(arr)
-        cftime_times.append(cftime_duration)
-        print(f"cftime_rs : {cftime_rs_duration:.4f} seconds")
-        print(f"cftime    : {cftime_duration:.4f} seconds")
-    return cftime_rs_times, cftime_times
+        print(f"Number of Iterations {label}: {n}")
+        arr = ARRS[n]
 
+        for benchmark_func, benchmark_times in zip(benchmark_funcs, times):
+            duration = benchmark_func(arr)
+            benchmark_times.append(duration)
+            print(f"{benchmark_func.__name__} : {duration:.6f} seconds")
+    return times
 
-def cftime_rs_benchmark_pydatetime_without_str(arr: np.array) -> float:
-    cftime_rs_start = time.time()
-    datetimes = cftime_rs.num2pydate(arr, UNITS, CALENDAR)
-    _ = cftime_rs.pydate2num(datetimes, UNITS, CALENDAR, dtype="int")
-    cftime_rs_end = time.time()
-    return cftime_rs_end - cftime_rs_start
+
+def get_data_with_str() -> Tuple[List[float], List[float]]:
+    cftime_rs_times, cftime_times = run_benchmark(
+        [cftime_rs_benchmark, cftime_benchmark], "with str"
+    )
+    return cftime_rs_times, cftime_times
 
 
-def cftime_benchmark_pydatetime_without_str(arr: np.array) -> float:
-    cftime_start = time.time()
-    datetimes = cftime.num2date(arr, UNITS, CALENDAR, only_use_python_datetimes=True)
-    _ = cftime.date2num(datetimes, UNITS, CALENDAR)
-    cftime_end = time.time()
-    return cftime_end - cftime_start
+def get_data_without_str() -> Tuple[List[float], List[float]]:
+    cftime_rs_times, cftime_times = run_benchmark(
+        [cftime_rs_benchmark_without_str, cftime_benchmark_without_str], "without str"
+    )
+    return cftime_rs_times, cftime_times
 
 
 def get_data_pydatetime_without_str() -> Tuple[List[float], List[float]]:
-    cftime_rs_times = []
-    cftime_times = []
-    print("cftime_rs_benchmark_pydatetime_without_str")
-    for n in ITERATIONS:
-        print(f"Number of Iterations with str: {n}")
-        arr = np.array(range(n))
-
-        cftime_rs_duration = cftime_rs_benchmark_without_str(arr)
-        cftime_rs_times.append(cftime_rs_duration)
-        cftime_duration = cftime_benchmark_without_str(arr)
-        cftime_times.append(cftime_duration)
-        print(f"cftime_rs : {cftime_rs_duration:.4f} seconds")
-        print(f"cftime    : {cftime_duration:.4f} seconds")
+    cftime_rs_times, cftime_times = run_benchmark(
+        [
+            cftime_rs_benchmark_pydatetime_without_str,
+            cftime_benchmark_pydatetime_without_str,
+        ],
+        "with python datetimes without str",
+    )
     return cftime_rs_times, cftime_times
 
 
 if __name__ == "__main__":
+    warm_up()
     cftime_rs_times, cftime_times = get_data_with_str()
     performance_comparison_chart(
         cftime_rs_times,
         cftime_times,
-        title="Performance Comparison: cftime_rs vs. cftime.\nDecoding, calling __str__ and encoding. \nLower is better",
+        title="Performance Comparison: cftime_rs vs. cftime.\nDecoding, formatting to str (date2str for cftime_rs) and encoding. \nLower is better",
         output_file="performance_comparison_with_str.png",
     )
     cftime_rs_times, cftime_times = get_data_without_str()
+    numba_times = get_data_numba() if numba is not None else None
     performance_comparison_chart(
         cftime_rs_times,
         cftime_times,
         title="Performance Comparison: cftime_rs vs. cftime./Decoding and encoding. \nLower is better",
         output_file="performance_comparison_without_str.png",
+        numba_time=numba_times,
     )
     cftime_rs_times, cftime_times = get_data_pydatetime_without_str()
     performance_comparison_chart(
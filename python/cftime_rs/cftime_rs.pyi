@@ -591,3 +591,19 @@ def pydate2num(
             List of numbers based on calendar, units, and dtype
     """
     ...
+
+def date2str(datetimes: List[PyCFDatetime]) -> List[str]:
+    """Convert a list of PyCFDatetime objects to their string representation.
+
+    This is equivalent to calling `str` on each PyCFDatetime but the whole
+    list is formatted in a single call to the Rust backend.
+
+    Args:
+        datetimes : List[PyCFDatetime]
+            List of PyCFDatetime objects
+
+    Returns:
+        List[str]
+            List of string representations of the datetimes
+    """
+    ...
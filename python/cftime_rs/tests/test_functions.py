@@ -3,74 +3,67 @@ import cftime_rs
 import datetime as dt
 
 
-def test_num2date():
-    arr = [1, 2, 3]
-    units = "days since 1970-01-01"
-    calendar = "standard"
+STANDARD_DATES = [(1, 1970, 1, 2), (2, 1970, 1, 3), (3, 1970, 1, 4)]
+STANDARD_UNITS = "days since 1970-01-01"
 
-    result = cftime_rs.num2date(arr, units, calendar)
-    cf_calendar = cftime_rs.PyCFCalendar.from_str("standard")
-    expected = [
-        cftime_rs.PyCFDatetime.from_ymd(1970, 1, 2, cf_calendar),
-        cftime_rs.PyCFDatetime.from_ymd(1970, 1, 3, cf_calendar),
-        cftime_rs.PyCFDatetime.from_ymd(1970, 1, 4, cf_calendar),
-    ]
-    assert [i.ymd_hms() for i in result] == [i.ymd_hms() for i in expected]
 
+@pytest.fixture(scope="session")
+def std_calendar():
+    return cftime_rs.PyCFCalendar.from_str("standard")
 
-def test_date2num():
-    units = "days since 1970-01-01"
-    calendar = "standard"
 
-    cf_calendar = cftime_rs.PyCFCalendar.from_str("standard")
-    dates = [
-        cftime_rs.PyCFDatetime.from_ymd(1970, 1, 2, cf_calendar),
-        cftime_rs.PyCFDatetime.from_ymd(1970, 1, 3, cf_calendar),
-        cftime_rs.PyCFDatetime.from_ymd(1970, 1, 4, cf_calendar),
-    ]
-    expected = [1, 2, 3]
-    result = cftime_rs.date2num(dates, units, calendar, dtype="i64")
-    assert result == expected
+@pytest.mark.parametrize("dates", [STANDARD_DATES, STANDARD_DATES[::-1]])
+def test_num2date(dates):
+    numbers = [n for n, _, _, _ in dates]
+    result = cftime_rs.num2date(numbers, STANDARD_UNITS, "standard")
+    assert [i.ymd_hms() for i in result] == [(y, m, d, 0, 0, 0) for _, y, m, d in dates]
 
 
-def test_pydate2num():
-    units = "days since 1970-01-01"
-    calendar = "standard"
-    dates = [
-        dt.datetime(1970, 1, 2),
-        dt.datetime(1970, 1, 3),
-        dt.datetime(1970, 1, 4),
+@pytest.mark.parametrize("dates", [STANDARD_DATES, STANDARD_DATES[::-1]])
+def test_date2num(std_calendar, dates):
+    cf_dates = [
+        cftime_rs.PyCFDatetime.from_ymd(y, m, d, std_calendar) for _, y, m, d in dates
     ]
-    expected = [1, 2, 3]
-    result = cftime_rs.pydate2num(dates, units, calendar, dtype="i64")
-    assert result == expected
+    result = cftime_rs.date2num(cf_dates, STANDARD_UNITS, "standard", dtype="i64")
+    assert result == [n for n, _, _, _ in dates]
 
 
-def test_num2pydate():
-    arr = [1, 2, 3]
-    units = "days since 1970-01-01"
-    calendar = "standard"
+@pytest.mark.parametrize("dates", [STANDARD_DATES, STANDARD_DATES[::-1]])
+def test_pydate2num(dates):
+    pydates = [dt.datetime(y, m, d) for _, y, m, d in dates]
+    result = cftime_rs.pydate2num(pydates, STANDARD_UNITS, "standard", dtype="i64")
+    assert result == [n for n, _, _, _ in dates]
+
 
-    result = cftime_rs.num2pydate(arr, units, calendar)
+@pytest.mark.parametrize("dates", [STANDARD_DATES, STANDARD_DATES[::-1]])
+def test_num2pydate(dates):
+    numbers = [n for n, _, _, _ in dates]
+    result = cftime_rs.num2pydate(numbers, STANDARD_UNITS, "standard")
     result = [i.replace(tzinfo=None) for i in result]
-    expected = [
-        dt.datetime(1970, 1, 2),
-        dt.datetime(1970, 1, 3),
-        dt.datetime(1970, 1, 4),
+    assert result == [dt.datetime(y, m, d) for _, y, m, d in dates]
+
+
+def test_date2str(std_calendar):
+    dates = [
+        cftime_rs.PyCFDatetime.from_ymd(y, m, d, std_calendar)
+        for _, y, m, d in STANDARD_DATES
+    ]
+    result = cftime_rs.date2str(dates)
+    assert result == [
+        "1970-01-02 00:00:00.000",
+        "1970-01-03 00:00:00.000",
+        "1970-01-04 00:00:00.000",
     ]
-    assert result == expected
+
+
+def test_date2str_empty():
+    assert cftime_rs.date2str([]) == []
 
 
 def test_num2date_for_float():
     arr = [95795.0]
-    units = "days since 1970-01-01"
-    calendar = "standard"
-    cf_calendar = cftime_rs.PyCFCalendar.from_str("standard")
-    expected = [
-        cftime_rs.PyCFDatetime.from_ymd(2232, 4, 12, cf_calendar),
-    ]
-    result = cftime_rs.num2date(arr, units, calendar)
-    assert [i.ymd_hms() for i in result] == [i.ymd_hms() for i in expected]
+    result = cftime_rs.num2date(arr, STANDARD_UNITS, "standard")
+    assert [i.ymd_hms() for i in result] == [(2232, 4, 12, 0, 0, 0)]
 
 
 def test_idempotence_of_num2pydate_then_pydate2num_for_float():
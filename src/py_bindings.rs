@@ -611,6 +611,11 @@ fn pydate2num(
     }
 }
 
+#[pyfunction]
+fn date2str(datetimes: Vec<PyCFDatetime>) -> Vec<String> {
+    datetimes.iter().map(|dt| dt.dt.to_string()).collect()
+}
+
 /// cftime_rs is a python module that is implemented in Rust.
 #[pymodule]
 fn cftime_rs(_py: Python, m: &PyModule) -> PyResult<()> {
@@ -618,6 +623,7 @@ fn cftime_rs(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(date2num, m)?)?;
     m.add_function(wrap_pyfunction!(num2pydate, m)?)?;
     m.add_function(wrap_pyfunction!(pydate2num, m)?)?;
+    m.add_function(wrap_pyfunction!(date2str, m)?)?;
     m.add_class::<PyCFCalendar>()?;
     m.add_class::<PyCFDuration>()?;
     m.add_class::<PyCFDatetime>()?;